@@ -10,17 +10,16 @@ from __future__ import annotations
 
 import abc
 from collections.abc import (
-    Callable, Coroutine, Iterator, Mapping, MutableMapping, Sequence, Set)
+    Callable, Coroutine, Iterator, Mapping, MutableMapping, Sequence)
 import dataclasses as dc
-import difflib
 import enum
 import logging
 import sys
 from typing import Any, ClassVar, Final, Optional, overload, TypeVar, Union
 import warnings
-import weakref
 
 from .exceptions import EdzedCircuitError, EdzedInvalidState, EdzedUnknownEvent
+from .utils.sigdiff import setdiff_msg, valuediff_msg
 
 
 __all__ = [
@@ -64,20 +63,27 @@ class Const:
         output -- constant value
     """
 
-    __slots__ = ('_output', '__weakref__')
-    _instances: MutableMapping[Any, Const] = weakref.WeakValueDictionary()
+    __slots__ = ('_output',)
+    # A plain dict with a size limit holds strong references, that's why only
+    # immutable scalars are shared. The key includes the type, because equal
+    # values like 1, 1.0 and True must not share one instance.
+    _instances: dict[tuple[type, Any], Const] = {}
+    _MAX_INSTANCES = 4096
+    _SHARED_TYPES = frozenset([bool, int, float, str, bytes, type(None)])
 
     def __new__(cls, const: Any) -> Const:
+        const_type = type(const)
+        if const_type not in cls._SHARED_TYPES:
+            return super().__new__(cls)
+        key = (const_type, const)
         try:
-            return cls._instances[const]
+            return cls._instances[key]
             # __init__ will be invoked anyway
         except KeyError:
-            hashable = True
-        except TypeError:
-            hashable = False
+            pass
         new = super().__new__(cls)
-        if hashable:
-            cls._instances[const] = new
+        if len(cls._instances) < cls._MAX_INSTANCES:
+            cls._instances[key] = new
         return new
 
     def __init__(self, const: Any) -> None:
@@ -105,6 +111,15 @@ def check_name(name: Any, nametype: str) -> None:
         raise ValueError(f"{nametype} must be a non-empty string")
 
 
+def check_etype(etype: Any) -> None:
+    """Raise if etype is not a valid event type."""
+    if isinstance(etype, str):
+        if not etype:
+            raise ValueError("Event name must be a non-empty string")
+    elif not isinstance(etype, EventType):
+        raise TypeError(f"Event type must be a string or EventType, but got {etype!r}")
+
+
 def _is_multiple(arg: Any) -> bool:
     """
     Check if arg specifies multiple ordered items (inputs, events, etc.)
@@ -143,6 +158,12 @@ class Block:
     Base class for a circuit building block.
     """
 
+    # Subclasses without __slots__ get a __dict__, i.e. concrete
+    # blocks may still have additional attributes (e.g. x_NAME).
+    __slots__ = (
+        'circuit', 'name', 'comment', 'debug',
+        '_output_events', 'oconnections', '_output', '__weakref__')
+
     def __init__(
             self,
             name: Optional[str],
@@ -196,7 +217,14 @@ class Block:
 
     def log_msg(self, msg: str, *args, level: int, **kwargs) -> None:
         """Add own name and log the message with given priority level."""
-        _logger.log(level, f"{self}: {msg}", *args, **kwargs)
+        if not _logger.isEnabledFor(level):
+            return
+        # let the logger format the message; without args the msg
+        # must not be interpreted as a format string
+        if args:
+            _logger.log(level, "%s: " + msg, self, *args, **kwargs)
+        else:
+            _logger.log(level, "%s: %s", self, msg, **kwargs)
 
     def log_debug(self, *args, **kwargs) -> None:
         """Log a message only if debugging is enabled."""
@@ -223,15 +251,12 @@ class Block:
 
     def has_method(self, method: str) -> bool:
         """Check if a method is defined and is not a dummy."""
-        try:
-            attr = getattr(self, method)
-        except AttributeError:
+        attr = getattr(self, method, None)
+        if attr is None:
             return False
-        if any(
-                # pylint: disable=comparison-with-callable
-                # must convert the class method to a bound method for comparison
-                attr == dm.__get__(self, type(self))
-                for dm in (SBlock.dummy_method, SBlock.dummy_async_method)):
+        # compare the functions underlying the bound methods
+        func = getattr(attr, '__func__', None)
+        if func is Block.dummy_method or func is Block.dummy_async_method:
             return False
         return callable(attr)
 
@@ -268,6 +293,18 @@ class Block:
             return super().__str__()
 
 
+def _send_output_events(
+        events: Sequence[Event], source: Block, previous: Any, value: Any) -> None:
+    """Send output events. Event-like objects must be sent with send()."""
+    for event in events:
+        data = {'trigger': 'output', 'previous': previous, 'value': value}
+        if type(event) is Event:    # pylint: disable=unidiomatic-typecheck
+            # the same as send(), but without the keyword arguments round-trip
+            event._send(source, data)     # pylint: disable=protected-access
+        else:
+            event.send(source, **data)
+
+
 class CBlock(Block, metaclass=abc.ABCMeta):
     """
     Base class for combinational blocks.
@@ -281,22 +318,35 @@ class CBlock(Block, metaclass=abc.ABCMeta):
         or as an attribute.
         """
 
-        __slots__ = ['_blk']
+        __slots__ = ['_blk', '_inputs']
 
         def __init__(self, blk: CBlock) -> None:
             self._blk = blk
+            # the inputs dict is modified in place during the circuit
+            # finalization, a direct reference saves one lookup per access
+            self._inputs = blk.inputs
 
         def __getitem__(self, name: str) -> Any:
-            iblk = self._blk.inputs[name]
-            if isinstance(iblk, tuple):
-                return tuple(b.output for b in iblk)
-            return iblk.output
+            iblk = self._inputs[name]
+            # Inputs are Blocks or Consts after finalization, both have the _output slot.
+            # Reading it directly bypasses the read-only output property.
+            # groups are always plain tuples
+            if type(iblk) is tuple:     # pylint: disable=unidiomatic-typecheck
+                # a list comprehension is faster than a generator here
+                return tuple([b._output for b in iblk])  # pylint: disable=consider-using-generator
+            return iblk._output
 
         def __getattr__(self, name: str) -> Any:
+            # same as __getitem__, inlined to save a method call
             try:
-                return self[name]
+                iblk = self._inputs[name]
             except KeyError:
                 raise AttributeError(f"{self._blk} has no input {name!r}") from None
+            if type(iblk) is tuple:     # pylint: disable=unidiomatic-typecheck
+                return tuple([b._output for b in iblk])  # pylint: disable=consider-using-generator
+            return iblk._output
+
+    __slots__ = ('iconnections', 'inputs', '_in')
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """Verify that no SBlock add-ons were added to a CBlock."""
@@ -365,51 +415,6 @@ class CBlock(Block, metaclass=abc.ABCMeta):
         """
         Check an expected signature 'esig' with the actual one.
         """
-        def setdiff_msg(actual: Set[str], expected: Set[str]) -> str:
-            """Return a message describing a diff of two sets of names."""
-            unexpected = actual - expected
-            missing = expected - actual
-            msgparts = []
-            if unexpected:
-                subparts = []
-                for name in unexpected:
-                    if (suggestions := difflib.get_close_matches(name, missing, n=3)):
-                        top3 = ' or '.join(repr(s) for s in suggestions)
-                        subparts.append(f"{name!r} (did you mean {top3} ?)")
-                    else:
-                        subparts.append(repr(name))
-                msgparts.append("unexpected: " + ', '.join(subparts))
-            if missing:
-                msgparts.append("missing: " + ', '.join(repr(name) for name in missing))
-            return ", ".join(msgparts)
-
-        def valuediff_msg(
-                name: str,
-                value: None|int,
-                expected: None|int|Sequence[None|int]
-                ) -> Optional[str]:
-            """Return a message describing a diff in signature items."""
-            if expected is None:
-                if value is not None:
-                    return f"{name}: is a group, expected was a single input"
-            elif value is None:
-                return f"{name}: is a single input, expected was a group"
-            elif isinstance(expected, int):
-                if value != expected:
-                    return f"group {name}: input count is {value}, expected was {expected}"
-            else:
-                try:
-                    cmin, cmax = expected
-                except Exception:
-                    raise ValueError(
-                        f"check_signature: input {name!r}: invalid value {expected!r}"
-                        ) from None
-                if cmin is not None and value < cmin:
-                    return f"group {name}: input count is {value}, minimum is {cmin}"
-                if cmax is not None and value > cmax:
-                    return f"group {name}: input count is {value}, maximum is {cmax}"
-            return None # no error
-
         bsig = self.input_signature()   # block signature
         if bsig != esig:
             if bsig.keys() != esig.keys():
@@ -438,12 +443,13 @@ class CBlock(Block, metaclass=abc.ABCMeta):
         value = self.calc_output()
         if value is UNDEF:
             raise ValueError("Output value must not be <UNDEF>")
-        if previous == value:
+        if previous is value or previous == value:
             return False
-        self.log_debug("output: %s -> %s", previous, value)
+        if self.debug:
+            self.log_debug("output: %s -> %s", previous, value)
         self._output = value
-        for event in self._output_events:
-            event.send(self, trigger='output', previous=previous, value=value)
+        if self._output_events:
+            _send_output_events(self._output_events, self, previous, value)
         return True
 
     def get_conf(self) -> dict[str, Any]:
@@ -461,7 +467,10 @@ class SBlock(Block):
     Base class for sequential blocks, i.e. blocks with internal state.
     """
 
-    _ct_handlers: dict[str, Callable]   # event handling methods _event_NAME
+    __slots__ = (
+        'initdef', '_event_active', '_every_output_events', 'init_steps_completed')
+
+    _ct_handlers: ClassVar[dict[str, Callable]]     # event handling methods _event_NAME
 
     def __init_subclass__(cls, *args, **kwargs) -> None:
         """
@@ -470,25 +479,21 @@ class SBlock(Block):
         This is important for a correct order of method calls.
         """
         super().__init_subclass__(*args, **kwargs)
+        mro = cls.__mro__
+        sblock_idx = mro.index(SBlock)
+        for base in mro[sblock_idx+1:]:
+            if issubclass(base, Addon):
+                # DO NOT catch this error until https://bugs.python.org/issue38085 is fixed
+                raise TypeError(
+                    f"The order of {cls.__name__} base classes is incorrect: "
+                    + f"add-ons like {base.__name__} must appear before SBlock")
+
         cls._ct_handlers = {}
-        sblock_seen = False
-        for mro in cls.__mro__:
-            if sblock_seen:
-                if issubclass(mro, Addon):
-                    # DO NOT catch this error until https://bugs.python.org/issue38085 is fixed
-                    raise TypeError(
-                        f"The order of {cls.__name__} base classes is incorrect: "
-                        + f"add-ons like {mro.__name__} must appear before SBlock")
-            elif mro is SBlock:
-                sblock_seen = True
-
-            if issubclass(mro, (SBlock, Addon)):
-                for method_name, method in vars(mro).items():
-                    etype = method_name.removeprefix('_event_')
-                    # .removeprefix() returns the string unchanged if prefix was not found
-                    if etype is not method_name and etype not in cls._ct_handlers:
-                        cls._ct_handlers[etype] = method
-        assert sblock_seen
+        # Handlers defined in classes earlier in the MRO take precedence.
+        # All SBlocks and add-ons precede the SBlock base class in the MRO.
+        for base in reversed(mro[:sblock_idx+1]):
+            if issubclass(base, (SBlock, Addon)):
+                cls._ct_handlers.update(_own_handlers(base))
 
     def __init__(
             self, *args,
@@ -508,18 +513,20 @@ class SBlock(Block):
         if value is UNDEF:
             raise ValueError("Output value must not be <UNDEF>")
         previous = self._output
-        if previous == value:
+        if previous is value or previous == value:
             if not self._every_output_events:
                 return
-            self.log_debug("output: %s (unchanged)", value)
+            if self.debug:
+                self.log_debug("output: %s (unchanged)", value)
         else:
-            self.log_debug("output: %s -> %s", previous, value)
+            if self.debug:
+                self.log_debug("output: %s -> %s", previous, value)
             self._output = value
             self.circuit.sblock_queue.put_nowait(self)
-            for event in self._output_events:
-                event.send(self, trigger='output', previous=previous, value=value)
-        for event in self._every_output_events:
-            event.send(self, trigger='output', previous=previous, value=value)
+            if self._output_events:
+                _send_output_events(self._output_events, self, previous, value)
+        if self._every_output_events:
+            _send_output_events(self._every_output_events, self, previous, value)
 
     def _event(self, etype: str|EventType, data: Mapping[str, Any]) -> Any:
         """
@@ -548,23 +555,35 @@ class SBlock(Block):
         simulator is no longer ready, but cannot distinguish internal
         and external events.
         """
+        handler = None
+        conditional = False
         if isinstance(etype, str):
-            if not etype:
-                raise ValueError("Event name must not be empty")
-        elif not isinstance(etype, EventType):
-            raise TypeError(
-                f"Event type must be either a string or an EventType, but got {etype!r}")
-        self.log_debug("got event %r, data: %s", etype, data)
+            handler = type(self)._ct_handlers.get(etype)
+            if handler is None:
+                # valid event types with a handler don't need to be checked
+                check_etype(etype)
+        elif isinstance(etype, EventCond):
+            # EventCond items were checked in EventCond.__post_init__
+            conditional = True
+        else:
+            check_etype(etype)
+        if self.debug:
+            self.log_debug("got event %r, data: %s", etype, data)
         if self._event_active:
             raise EdzedCircuitError(f"{self}: Forbidden recursive event() call")
         self._event_active = True
         try:
-            while isinstance(etype, EventCond):
-                cond_etype = etype.etrue if data.get('value') else etype.efalse
-                self.log_debug("conditional event -> %r", etype)
-                if cond_etype is None:
-                    return None
-                etype = cond_etype
+            if conditional:
+                value = bool(data.get('value'))
+                while isinstance(etype, EventCond):
+                    cond_etype = etype.etrue if value else etype.efalse
+                    if self.debug:
+                        self.log_debug("conditional event -> %r", cond_etype)
+                    if cond_etype is None:
+                        return None
+                    etype = cond_etype
+                    if isinstance(etype, str):
+                        handler = type(self)._ct_handlers.get(etype)
             if 0 <= self.init_steps_completed < 2:
                 # a destination block may be uninitialized, because events
                 # may be generated during the initialization process
@@ -572,12 +591,8 @@ class SBlock(Block):
                 # the initialization may be carried out with an event, let's enable it
                 with self._enable_event:    # type: ignore[attr-defined]
                     self.circuit.init_sblock(self, full=True)
-            if isinstance(etype, str):
-                handler = type(self)._ct_handlers.get(etype)
-            else:
-                handler = None
             try:
-                if handler:
+                if handler is not None:
                     # handler is an unbound method
                     retval = handler(self, **data)
                 else:
@@ -679,6 +694,23 @@ class Addon:
     """
 
 
+def _own_handlers(cls: type) -> dict[str, Callable]:
+    """Return event handling methods _event_NAME defined directly in 'cls' (cached)."""
+    handlers = cls.__dict__.get('_ct_own_handlers')
+    if handlers is not None:
+        return handlers
+    handlers = {}
+    for method_name, method in vars(cls).items():
+        etype = method_name.removeprefix('_event_')
+        # .removeprefix() returns the string unchanged if prefix was not found
+        # a callable check excludes slots like _event_active
+        if etype is not method_name and callable(method):
+            handlers[sys.intern(etype)] = method
+    # the attribute is inherited by subclasses, that's why it is read from cls.__dict__
+    setattr(cls, '_ct_own_handlers', handlers)
+    return handlers
+
+
 class EventType:
     """
     A base class for all special event types.
@@ -704,6 +736,12 @@ class EventCond(EventType):
     etrue: Optional[str|EventType]
     efalse: Optional[str|EventType]
 
+    def __post_init__(self) -> None:
+        for etype in (self.etrue, self.efalse):
+            if etype is not None:
+                check_etype(etype)
+
+
 EvDataType = MutableMapping[str, Any]
 EvFilterType = Callable[[EvDataType], Any]
 
@@ -713,6 +751,8 @@ class Event:
     An internal (block to block) event.
     """
 
+    __slots__ = ('_dest', '_dest_event', '_etype', '_filters')
+
     #pylint: disable=too-many-arguments
     def __init__(
             self,
@@ -730,8 +770,12 @@ class Event:
                 dest=dest, etype=etype, interval=repeat, count=count)
         elif count is not None:
             raise ValueError("Argument 'count' is valid only with 'repeat'")
-        self.typecheck(etype)
+        check_etype(etype)
+        if type(etype) is str:     # pylint: disable=unidiomatic-typecheck
+            # interned strings speed up the handler lookup in SBlock.event()
+            etype = sys.intern(etype)
         self._dest = dest
+        self._dest_event: Optional[Callable[..., Any]] = None   # bound dest.event, set by _send
         self._etype = etype
         self._filters = efilter_tuple(efilter)
         simulator.get_circuit().resolve_name(self, '_dest', SBlock)
@@ -751,13 +795,32 @@ class Event:
     def abort(cls) -> Event:
         return cls('_ctrl', 'abort')
 
-    @staticmethod
-    def typecheck(etype: Any) -> None:
-        if isinstance(etype, str):
-            if not etype:
-                raise ValueError("Event name must be a non-empty string")
-        elif not isinstance(etype, EventType):
-            raise TypeError(f"Event type must be a string or EventType, but got {etype!r}")
+    typecheck = staticmethod(check_etype)
+
+    def _apply_filters(self, data: EvDataType) -> Optional[EvDataType]:
+        """
+        Pass the event data through all filters.
+
+        Return the resulting data or None if rejected by a filter.
+        """
+        for efilter in self._filters:
+            retval = efilter(data)
+            rtype = type(retval)
+            # fast paths for the usual return types; avoid the slow ABC isinstance check
+            if rtype is bool:
+                if retval:
+                    continue
+                return None
+            if rtype is dict or isinstance(retval, MutableMapping):
+                for key in retval:
+                    if not isinstance(key, str):
+                        raise TypeError(
+                            f"Event filter {efilter.__name__} returned non-string key {key!r} "
+                            + f"(value {retval[key]})")
+                data = retval
+            elif not retval:
+                return None
+        return data
 
     def send(self, source: Block, /, **data) -> bool:
         """
@@ -767,28 +830,35 @@ class Event:
 
         Return True if sent, False if rejected by a filter.
         """
+        return self._send(source, data)
+
+    def _send(self, source: Block, data: EvDataType) -> bool:
+        """
+        Like send(), but take the event data as a dict.
+
+        The dict is modified in place and must not be shared with other events.
+        """
         dest = self._dest
         # in a finalized circuit there are no references by name
         assert isinstance(dest, SBlock), (
             f"Incorrect destination type in {self}, circuit not finalized?")
+        if (dest_event := self._dest_event) is None:
+            dest_event = self._dest_event = dest.event
         if not source.circuit is dest.circuit is simulator.get_circuit():
             raise EdzedCircuitError(
                 f"{self}: source {source} and/or destination not in the current circuit")
         data['source'] = source.name
-        for efilter in self._filters:
-            retval = efilter(data)
-            if isinstance(retval, MutableMapping):
-                for key in retval:
-                    if not isinstance(key, str):
-                        raise TypeError(
-                            f"Event filter {efilter.__name__} returned non-string key {key!r} "
-                            + f"(value {retval[key]})")
-                data = retval   # type: ignore[assignment]
-            elif not retval:
-                source.log_debug(f"Not sending event {self} (rejected by a filter)")
+        if self._filters:
+            # events without filters are the common case
+            filtered = self._apply_filters(data)
+            if filtered is None:
+                if source.debug:
+                    source.log_debug("Not sending event %s (rejected by a filter)", self)
                 return False
-        source.log_debug("sending event %s", self)
-        dest.event(self._etype, **data)
+            data = filtered
+        if source.debug:
+            source.log_debug("sending event %s", self)
+        dest_event(self._etype, **data)
         return True
 
     def __str__(self):
@@ -892,17 +962,23 @@ def _to_tuple(args, validator):
     return args
 
 
+def _validate_event(event: Any) -> None:
+    if not hasattr(event, 'send'):
+        raise TypeError(f"Expected was an Event-like object, got {event!r}")
+
+
+def _validate_efilter(efilter: Any) -> None:
+    if not callable(efilter):
+        raise TypeError(f"Expected was a callable, got {efilter!r}")
+
+
 def event_tuple(events: zero_or_more[Event])-> tuple[Event, ...]:
     """
     Transform the argument to a tuple of events.
 
     Accept a single event or a sequence of events.
     """
-    def validator(event):
-        if not hasattr(event, 'send'):
-            raise TypeError(f"Expected was an Event-like object, got {event!r}")
-
-    return _to_tuple(events, validator)
+    return _to_tuple(events, _validate_event)
 
 
 def efilter_tuple(
@@ -912,11 +988,7 @@ def efilter_tuple(
 
     Accept a single event filter or a sequence of filters.
     """
-    def validator(efilter):
-        if not callable(efilter):
-            raise TypeError(f"Expected was a callable, got {efilter!r}")
-
-    return _to_tuple(efilters, validator)
+    return _to_tuple(efilters, _validate_efilter)
 
 
 # importing at the end when all names are defined resolves a circular import issue
@@ -21,12 +21,18 @@ class Not(block.CBlock):
     """
     Boolean negation.
     """
+    def __init__(self, *args, **kwargs):
+        self._input: block.Block|block.Const   # the only input, set in start()
+        super().__init__(*args, **kwargs)
+
     def calc_output(self) -> bool:
-        return not self._in['_'][0]
+        return not self._input._output  # pylint: disable=protected-access
 
     def start(self) -> None:
         super().start()
         self.check_signature({'_': 1})
+        # the only input; it does not change after the circuit finalization
+        self._input = self.inputs['_'][0]
 
 
 class FuncBlock(block.CBlock):
@@ -37,20 +43,28 @@ class FuncBlock(block.CBlock):
     def __init__(self, *args, func: Callable, unpack: bool = True, **kwargs):
         self._func = func
         self._unpack = unpack
+        # input names, set in start()
+        self._has_args: bool
+        self._kwnames: tuple[str, ...]
         super().__init__(*args, **kwargs)
 
     def calc_output(self) -> Any:
-        kwargs = {name: self._in[name] for name in self.inputs}
-        args = kwargs.pop('_', ())
+        inp = self._in
+        args = inp['_'] if self._has_args else ()
+        kwargs = {name: inp[name] for name in self._kwnames}
         if self._unpack:
             return self._func(*args, **kwargs)
         return self._func(args, **kwargs)
 
     def start(self) -> None:
+        # input names do not change after the circuit finalization
+        self._has_args = '_' in self.inputs
+        self._kwnames = tuple(name for name in self.inputs if name != '_')
         try:
             func = self._func
             self._func = inspect.signature(func).bind
-            self.calc_output()
+            # not self.calc_output(), subclasses may bypass self._func
+            FuncBlock.calc_output(self)
         except TypeError as err:
             raise TypeError(
                 f"function {func.__qualname__} does not match the connected inputs: {err}"
@@ -60,26 +74,39 @@ class FuncBlock(block.CBlock):
         super().start()
 
 
+# The logical gates below are FuncBlocks, because FuncBlock.start() verifies
+# that only unnamed inputs (possibly none) are connected. Their calc_output() is specialized
+# and does not call the function through the generic FuncBlock machinery.
+
+def _xor(inputs: tuple) -> bool:
+    return bool(sum(1 for v in inputs if v) % 2)
+
+
 class And(FuncBlock):
     """Logical AND"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, func=all, unpack=False, **kwargs)
 
+    def calc_output(self) -> bool:
+        return all(self._in['_'] if self._has_args else ())
+
 
 class Or(FuncBlock):
     """Logical OR"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, func=any, unpack=False, **kwargs)
 
+    def calc_output(self) -> bool:
+        return any(self._in['_'] if self._has_args else ())
+
 
 class Xor(FuncBlock):
     """Logical XOR"""
     def __init__(self, *args, **kwargs):
-        super().__init__(
-            *args,
-            func=lambda inputs: bool(sum(1 for v in inputs if v) % 2),
-            unpack=False,
-            **kwargs)
+        super().__init__(*args, func=_xor, unpack=False, **kwargs)
+
+    def calc_output(self) -> bool:
+        return _xor(self._in['_'] if self._has_args else ())
 
 
 class Compare(block.CBlock):
@@ -93,18 +120,23 @@ class Compare(block.CBlock):
             raise ValueError("high threshold cannot be lower than low threshold")
         self._low = low
         self._high = high
+        self._mid = (low + high) / 2     # initial threshold
+        self._input: block.Block|block.Const   # the only input, set in start()
         super().__init__(*args, **kwargs)
 
     def calc_output(self) -> bool:
-        if self._output is block.UNDEF:
-            thr = (self._low + self._high) / 2
+        output = self._output
+        if output is block.UNDEF:
+            thr = self._mid
         else:
-            thr = self._low if self._output else self._high
-        return self._in['_'][0] >= thr
+            thr = self._low if output else self._high
+        return self._input._output >= thr  # pylint: disable=protected-access
 
     def start(self) -> None:
         super().start()
         self.check_signature({'_': 1})
+        # the only input; it does not change after the circuit finalization
+        self._input = self.inputs['_'][0]
 
 
 class Override(block.CBlock):
@@ -31,6 +31,14 @@ _TT_ERROR = 2.5         # do a reset when exceeded
 _SET24 = frozenset(dt.time(hour, 0, 0) for hour in range(24))
 
 
+def _seconds_of_day(time_of_day: dt.time) -> float:
+    """Convert time of day to seconds since midnight."""
+    return (SEC_PER_HOUR*time_of_day.hour
+        + SEC_PER_MIN*time_of_day.minute
+        + time_of_day.second
+        + time_of_day.microsecond / 1_000_000.0)
+
+
 class Cron(addons.AddonMainTask, block.SBlock):
     """
     Simple cron service.
@@ -43,7 +51,7 @@ class Cron(addons.AddonMainTask, block.SBlock):
         super().__init__(*args, **kwargs)
         self._utc = bool(utc)
         self._alarms: dict[dt.time, set[block.SBlock]] = {}
-        self._queue: asyncio.Queue
+        self._wakeup: asyncio.Event    # reload request
         self._needs_reload = Flag(False)
 
     def dtnow(self) -> dt.datetime:
@@ -61,7 +69,7 @@ class Cron(addons.AddonMainTask, block.SBlock):
     def reload(self) -> None:
         """Reload the configuration after add_block/remove_block calls."""
         if self._needs_reload.test_clear() and self._mtask is not None:
-            self._queue.put_nowait(None)    # wake up the task, value does not matter
+            self._wakeup.set()      # wake up the task
 
     def _check_tz(self, time_of_day: dt.time) -> dt.time:
         """
@@ -124,9 +132,11 @@ class Cron(addons.AddonMainTask, block.SBlock):
         reset = Flag(False)
         reload = Flag(True)     # reload will also initialize the index
         short_sleep = False     # alternative sleep function used => do not compute overhead
+        timetable_secs: list[float] = []    # computed on the first reload below
         while True:
             if reload.test_clear():
                 timetable = sorted(_SET24.union(self._alarms))
+                timetable_secs = [_seconds_of_day(tod) for tod in timetable]
                 tlen = len(timetable)
                 self.log_debug("time schedule reloaded")
                 index = None
@@ -134,9 +144,11 @@ class Cron(addons.AddonMainTask, block.SBlock):
             nowdt = self.dtnow()
             nowt = nowdt.time()
             if index is None:
-                index = bisect.bisect_left(timetable, nowt) % tlen
+                index = bisect.bisect_left(timetable_secs, _seconds_of_day(nowt)) % tlen
             wakeup = timetable[index]
-            self.log_debug("wakeup time: %s", wakeup)
+            wakeup_secs = timetable_secs[index]
+            if self.debug:
+                self.log_debug("wakeup time: %s", wakeup)
 
             # sleep until the wakeup time:
             # step 0 - compute the delay until wakeup time
@@ -151,15 +163,12 @@ class Cron(addons.AddonMainTask, block.SBlock):
             #            B: do a reset otherwise
             for step in range(3):
                 # datetime.time does not support time arithmetic
-                sleeptime = (SEC_PER_HOUR*(wakeup.hour - nowt.hour)
-                    + SEC_PER_MIN*(wakeup.minute - nowt.minute)
-                    + (wakeup.second - nowt.second)
-                    + (wakeup.microsecond - nowt.microsecond)/ 1_000_000.0)
+                sleeptime = wakeup_secs - _seconds_of_day(nowt)
                 if nowt.hour == 23 and wakeup.hour == 0:
                     # wrap around midnight (relying on hourly wakeups in SET24)
                     sleeptime += SEC_PER_DAY
                 # sleeptime: negative = after the alarm time; positive = before the alarm time
-                if step == 0:
+                if step == 0 and self.debug:
                     self.log_debug("sleep until wakeup: %.3f sec", sleeptime)
                 if step > 1 or sleeptime < 0:
                     diff = abs(sleeptime)
@@ -194,10 +203,11 @@ class Cron(addons.AddonMainTask, block.SBlock):
                 else:
                     short_sleep = False
                     try:
-                        await asyncio.wait_for(self._queue.get(), sleeptime - overhead)
+                        await asyncio.wait_for(self._wakeup.wait(), sleeptime - overhead)
                     except asyncio.TimeoutError:
                         pass
                     else:
+                        self._wakeup.clear()
                         reload.set()
                         break
                 nowdt = self.dtnow()
@@ -211,7 +221,8 @@ class Cron(addons.AddonMainTask, block.SBlock):
                         ):
                     self.log_warning("Apparently a DST (summer time) clock change has occured.")
                 self.log_warning("Resetting due to a time tracking problem.")
-                for blk in set.union(*self._alarms.values()):    # all blocks
+                # set().union() instead of set.union(), because there might be no alarms
+                for blk in set().union(*self._alarms.values()):    # all blocks
                     assert hasattr(blk, 'recalc')
                     blk.recalc(nowdt)
                 index = None
@@ -219,9 +230,9 @@ class Cron(addons.AddonMainTask, block.SBlock):
             if reload:
                 continue
 
-            if wakeup in self._alarms:
+            if (blkset := self._alarms.get(wakeup)) is not None:
                 # .recalc() may alter the set we are iterating over
-                for blk in list(self._alarms[wakeup]):
+                for blk in tuple(blkset):
                     assert hasattr(blk, 'recalc')
                     blk.recalc(nowdt)
             index = (index + 1) % tlen
@@ -231,7 +242,7 @@ class Cron(addons.AddonMainTask, block.SBlock):
 
     def start(self) -> None:
         super().start()
-        self._queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
 
     def _event_get_schedule(self, **_data) -> dict[str, list[str]]:
         """Return the internal scheduling data for debugging or monitoring."""
@@ -11,6 +11,7 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping, MutableMapping
 import functools
 import logging
+import operator
 import types
 from typing import Any
 
@@ -22,6 +23,8 @@ __all__ = ['not_from_undef', 'Edge', 'Delta', 'DataEdit', 'IfOutput', 'IfNotIiti
 
 _logger = logging.getLogger(__package__)
 
+_get_value_previous = operator.itemgetter('value', 'previous')
+
 
 def not_from_undef(data: Mapping) -> bool:
     """Filter out the initial change from UNDEF to the first real value."""
@@ -43,22 +46,19 @@ class Edge:
         self._fall = bool(fall)
         self._urise = bool(u_rise) if u_rise is not None else self._rise
         self._ufall = bool(u_fall)
+        # lookup tables indexed by bool(value) and bool(previous)
+        self._utable = (self._ufall, self._urise)
+        self._table = ((False, self._rise), (self._fall, False))
         if not (rise or fall or u_rise or u_fall):
             _logger.warning(
                 "%s: all events will be filtered out!",
                 type(self).__name__)
 
     def __call__(self, data: Mapping) -> bool:
-        value = data['value']
-        previous = data['previous']
+        value, previous = _get_value_previous(data)
         if previous is block.UNDEF:
-            if self._urise if value else self._ufall:
-                return True
-        else:
-            previous = bool(previous)
-            if (not previous and self._rise) if value else (previous and self._fall):
-                return True
-        return False
+            return self._utable[bool(value)]
+        return self._table[bool(previous)][bool(value)]
 
 
 class Delta:
@@ -72,7 +72,14 @@ class Delta:
 
     def __call__(self, data: Mapping) -> bool:
         value = data['value']
-        if self._last is block.UNDEF or abs(self._last - value) >= self._delta:
+        last = self._last
+        if last is block.UNDEF:
+            self._last = value
+            return True
+        # same as abs(diff) >= delta, but without the abs() call
+        diff = value - last
+        delta = self._delta
+        if diff >= delta or -diff >= delta:
             self._last = value
             return True
         return False
@@ -89,7 +96,8 @@ class IfOutput:
 
     def __call__(self, data: Mapping) -> Mapping|None:
         assert isinstance(self._ctrl_blk, block.Block)      # a name should be resolved
-        return data if self._ctrl_blk.output else None
+        # reading the slot directly bypasses the read-only output property
+        return data if self._ctrl_blk._output else None
 
 
 class IfNotIitialized:
@@ -103,7 +111,8 @@ class IfNotIitialized:
 
     def __call__(self, data: Mapping) -> Mapping|None:
         assert isinstance(self._ctrl_blk, block.SBlock)     # a name should be resolved
-        return None if self._ctrl_blk.is_initialized() else data
+        # same as is_initialized(), but without a method call
+        return None if self._ctrl_blk._output is not block.UNDEF else data
 
 
 class _dualmethod:
@@ -140,7 +149,10 @@ class DataEdit:
     @_dualmethod
     def add(self, **kwargs) -> DataEdit:
         """Add key=value pairs. Existing values will be overwritten."""
-        self._editlist.append(lambda data: {**data, **kwargs})
+        def _edit(data: MutableMapping) -> MutableMapping:
+            data.update(kwargs)
+            return data
+        self._editlist.append(_edit)
         return self
 
     @_dualmethod
@@ -151,7 +163,10 @@ class DataEdit:
         # that a separate container must be created each time.
         src = types.SimpleNamespace(block=source)
         simulator.get_circuit().resolve_name(src, 'block')
-        self._editlist.append(lambda data: {**data, key: src.block.output})
+        def _edit(data: MutableMapping) -> MutableMapping:
+            data[key] = src.block._output     # pylint: disable=protected-access
+            return data
+        self._editlist.append(_edit)
         return self
 
     @_dualmethod
@@ -166,10 +181,17 @@ class DataEdit:
     @_dualmethod
     def delete(self, *args: str) -> DataEdit:
         """Delete listed keys. Non-existing keys are ignored."""
-        def _edit(data: MutableMapping) -> MutableMapping:
-            for key in args:
+        if len(args) == 1:
+            # deleting a single key is the common case
+            key = args[0]
+            def _edit(data: MutableMapping) -> MutableMapping:
                 data.pop(key, None)
-            return data
+                return data
+        else:
+            def _edit(data: MutableMapping) -> MutableMapping:
+                for key in args:
+                    data.pop(key, None)
+                return data
         self._editlist.append(_edit)
         return self
 
@@ -195,10 +217,10 @@ class DataEdit:
     @_dualmethod
     def permit(self, *args) -> DataEdit:
         """Delete all but listed keys."""
+        keep = frozenset(args)
         def _edit(data: MutableMapping) -> MutableMapping:
-            for key in list(data):
-                if key not in args:
-                    del data[key]
+            for key in data.keys() - keep:
+                del data[key]
             return data
         self._editlist.append(_edit)
         return self
@@ -216,12 +238,21 @@ class DataEdit:
     @_dualmethod
     def setdefault(self, **kwargs) -> DataEdit:
         """Add key=value pairs only if key is missing."""
-        self._editlist.append(lambda data: {**kwargs, **data})
+        def _edit(data: MutableMapping) -> MutableMapping:
+            for key, value in kwargs.items():
+                data.setdefault(key, value)
+            return data
+        self._editlist.append(_edit)
         return self
 
     def __call__(self, data: MutableMapping) -> MutableMapping|None:
-        for func in self._editlist:
+        editlist = self._editlist
+        if len(editlist) == 1:
+            # a single edit is the common case
+            return editlist[0](data)
+        for func in editlist:
+            # all edits return either the data or None for rejected events
             data = func(data)
-            if not isinstance(data, MutableMapping):
+            if data is None:
                 break
         return data
@@ -62,6 +62,11 @@ class Counter(addons.AddonPersistence, block.SBlock):
         if modulo == 0:
             raise ValueError("modulo must not be zero")
         self._mod = modulo
+        # The modulo does not change, choose the event update function once.
+        # It is stored unbound, a bound method would create a reference cycle.
+        cls = type(self)
+        self._update: Callable[[Counter, float], float] = (
+            cls._setplain if modulo is None else cls._setmod)
         super().__init__(*args, initdef=initdef, **kwargs)
 
     def _setmod(self, value: float) -> float:
@@ -69,17 +74,22 @@ class Counter(addons.AddonPersistence, block.SBlock):
         self.set_output(output)
         return output
 
+    def _setplain(self, value: float) -> float:
+        """_setmod() without modulo."""
+        self.set_output(value)
+        return value
+
     def _event_inc(self, *, amount: float = 1, **_data) -> float:
-        return self._setmod(self._output + amount)
+        return self._update(self, self._output + amount)
 
     def _event_dec(self, *, amount: float = 1, **_data) -> float:
-        return self._setmod(self._output - amount)
+        return self._update(self, self._output - amount)
 
     def _event_put(self, *, value: float, **_data) -> float:
-        return self._setmod(value)
+        return self._update(self, value)
 
     def _event_reset(self, **_data) -> float:
-        return self._setmod(self.initdef)
+        return self._update(self, self.initdef)
 
     init_from_value = _setmod
     _restore_state = _setmod
@@ -106,7 +116,9 @@ class Repeat(addons.AddonMainTask, block.SBlock):
         if count is not None and count < 0:
             # count = 0 (no repeating) is accepted
             raise ValueError("argument 'count' must not be negative")
-        self._queue: asyncio.Queue
+        # a single slot for the last received event data
+        self._data: dict[str, Any]
+        self._new_data: asyncio.Event
         self._count = count
         self._warning_logged = False
         super().__init__(*args, **kwargs)
@@ -116,22 +128,40 @@ class Repeat(addons.AddonMainTask, block.SBlock):
 
     async def _maintask(self) -> NoReturn:
         repeating = False
-        while True:
-            if not repeating:
-                # avoid wait_for() overhead when not repeating an event
-                data = await self._queue.get()
-                repeat = 0
-            else:
-                try:
-                    data = await asyncio.wait_for(self._queue.get(), self._interval)
+        data: dict[str, Any] = {}   # replaced by the first received event data
+        # A pending wait for new data survives the timeouts. Unlike wait_for(),
+        # this does not create and cancel a new task on every repetition.
+        wait_task: Optional[asyncio.Task] = None
+        try:
+            while True:
+                if not repeating and wait_task is None:
+                    # avoid the timeout overhead when not repeating an event
+                    await self._new_data.wait()
+                    received = True
+                else:
+                    if wait_task is None:
+                        wait_task = asyncio.create_task(self._new_data.wait())
+                    done, _ = await asyncio.wait(
+                        (wait_task,), timeout=self._interval if repeating else None)
+                    received = bool(done)
+                    if received:
+                        wait_task = None
+                if received:
+                    # only the last received event is repeated
+                    self._new_data.clear()
+                    data = self._data
                     repeat = 0
-                except asyncio.TimeoutError:
+                else:
                     repeat += 1
 
-            if repeat > 0:  # skip the original event
-                self.set_output(repeat)
-                self._repeated_event.send(self, **data, repeat=repeat)
-            repeating = self._count is None or repeat < self._count
+                if repeat > 0:  # skip the original event
+                    self.set_output(repeat)
+                    # pylint: disable-next=protected-access
+                    self._repeated_event._send(self, {**data, 'repeat': repeat})
+                repeating = self._count is None or repeat < self._count
+        finally:
+            if wait_task is not None:
+                wait_task.cancel()
 
     def _event(self, etype: str|block.EventType, data) -> None:
         if etype != self._repeated_event.etype:
@@ -144,12 +174,16 @@ class Repeat(addons.AddonMainTask, block.SBlock):
         # not to conceal a possible forbidden loop
         data['orig_source'] = data.get('source')
         self.set_output(0)
-        self._repeated_event.send(self, **data, repeat=0)
-        self._queue.put_nowait(data)
+        # _repeated_event is a plain Event, its send() may be bypassed;
+        # _send() modifies the dict, the saved data must not be passed directly
+        # pylint: disable-next=protected-access
+        self._repeated_event._send(self, {**data, 'repeat': 0})
+        self._data = data
+        self._new_data.set()
 
     def start(self) -> None:
         super().start()
-        self._queue = asyncio.Queue()
+        self._new_data = asyncio.Event()
 
 
 class ValuePoll(addons.AddonMainTask, addons.AddonAsyncInit, block.SBlock):
@@ -166,13 +200,24 @@ class ValuePoll(addons.AddonMainTask, addons.AddonAsyncInit, block.SBlock):
 
     async def _maintask(self) -> NoReturn:
         """Data acquisition task: repeatedly obtain a value."""
+        loop = asyncio.get_running_loop()
+        # the interval is measured from one function call to the next one,
+        # the time spent in the function does not cause a drift
+        deadline = loop.time()
         while True:
             value = self._func()
             if asyncio.iscoroutine(value):
                 value = await value
             if value is not block.UNDEF:
                 self.set_output(value)
-            await asyncio.sleep(self._interval)
+            deadline += self._interval
+            delay = deadline - loop.time()
+            if delay > 0.0:
+                await asyncio.sleep(delay)
+            else:
+                # the function call took too long, start a new schedule now
+                deadline = loop.time()
+                await asyncio.sleep(0)
 
     def init_from_value(self, value: Any) -> None:
         self.set_output(value)
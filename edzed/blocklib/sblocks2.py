@@ -224,7 +224,8 @@ class OutputAsync(addons.AddonAsync, block.SBlock):
             for ev in self._on_error:
                 ev.send(self, trigger='error', error=err, put=data)
         else:
-            self.log_debug("output task returned value %r", retval)
+            if self.debug:
+                self.log_debug("output task returned value %r", retval)
             for ev in self._on_success:
                 ev.send(self, trigger='success', value=retval, put=data)
         if self._guard_time > 0.0:
@@ -403,7 +404,8 @@ class OutputFunc(block.SBlock):
             for ev in self._on_error:
                 ev.send(self, trigger='error', error=err)
             return ('error', err)
-        self.log_debug("output function returned: %r", result)
+        if self.debug:
+            self.log_debug("output function returned: %r", result)
         for ev in self._on_success:
             ev.send(self, trigger='success', value=result)
         return ('result', result)
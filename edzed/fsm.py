@@ -29,6 +29,7 @@ __all__ = ['fsm_event_data', 'FSM', 'Goto', 'INF_TIME']
 
 P3_10 = sys.version_info >= (3, 10)
 INF_TIME = float('+inf')
+_MISSING: Any = object()    # a sentinel for dict lookups
 fsm_event_data: contextvars.ContextVar[Mapping] = contextvars.ContextVar('fsm_event_data')
 
 
@@ -328,7 +329,8 @@ class FSM(addons.AddonPersistence, block.SBlock):
 
     def _set_timer(self, duration: float, timed_event: str|block.EventType) -> None:
         """Start the timer (low-level)."""
-        self.log_debug("timer: %.3fs before %s", duration, timed_event)
+        if self.debug:
+            self.log_debug("timer: %.3fs before %s", duration, timed_event)
         self._active_timer = asyncio.get_running_loop().call_later(
             duration, self.event, timed_event)
 
@@ -345,7 +347,8 @@ class FSM(addons.AddonPersistence, block.SBlock):
         if duration == INF_TIME:
             return
         if duration <= 0.0:
-            self.log_debug("timer: zero delay before %s", timed_event)
+            if self.debug:
+                self.log_debug("timer: zero delay before %s", timed_event)
             self.event(timed_event)
             return
         self._set_timer(duration, timed_event)
@@ -440,10 +443,13 @@ class FSM(addons.AddonPersistence, block.SBlock):
             assert self._state is not block.UNDEF, (
                 f"A non-Goto event was sent to an uninitialized FSM {self} "
                 + "(ext_event() bypassed?)")
-            try:
-                newstate = self._ct_transition[(etype, self._state)]
-            except KeyError:
-                newstate = self._ct_transition.get((etype, None), None)
+            # a state specific transition (even to None) has precedence over
+            # the default one; the default is often used (e.g. Timer) and
+            # an exception would be slow
+            transition = self._ct_transition
+            newstate = transition.get((etype, self._state), _MISSING)
+            if newstate is _MISSING:
+                newstate = transition.get((etype, None))
             if newstate is None:
                 self.log_debug(
                     "No transition defined for event %s in state %s", etype, self._state)
@@ -482,7 +488,8 @@ class FSM(addons.AddonPersistence, block.SBlock):
                     self._run_cb('exit', self._state)
                     etype, data, newstate = self._next_event
                     self._next_event = None
-                self.log_debug("state: %s -> %s (event: %s)", self._state, newstate, etype)
+                if self.debug:
+                    self.log_debug("state: %s -> %s (event: %s)", self._state, newstate, etype)
                 self._state = newstate
                 with self._enable_event:        # type: ignore[attr-defined]
                     self._run_cb('enter', self._state)
@@ -589,10 +589,10 @@ class Circuit:
             """
             min_idep = min_blk = None
             for blk in block_set:
-                idep = sum(1 for inp in blk.iconnections if inp in block_set)
-                if idep == 0:
+                if blk.iconnections.isdisjoint(block_set):
                     # 0 is the absolute minimum, no need to search further
                     return blk
+                idep = len(blk.iconnections & block_set)
                 if min_idep is None or idep < min_idep:
                     min_idep = idep
                     min_blk = blk
@@ -605,9 +605,11 @@ class Circuit:
         queue = self.sblock_queue
         while True:
             if not eval_set and queue.empty():
-                self.log_debug("%d block(s) evaluated, pausing", eval_cnt)
+                if self.debug:
+                    self.log_debug("%d block(s) evaluated, pausing", eval_cnt)
                 sblk = await queue.get()
-                self.log_debug("output change in %s, resuming", sblk)
+                if self.debug:
+                    self.log_debug("output change in %s, resuming", sblk)
                 eval_cnt = 0
                 eval_set |= sblk.oconnections
             while not queue.empty():
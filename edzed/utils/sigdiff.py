@@ -0,0 +1,56 @@
+"""
+Diagnostic messages for CBlock.check_signature().
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence, Set
+import difflib
+from typing import Optional
+
+
+def setdiff_msg(actual: Set[str], expected: Set[str]) -> str:
+    """Return a message describing a diff of two sets of names."""
+    unexpected = actual - expected
+    missing = expected - actual
+    msgparts = []
+    if unexpected:
+        subparts = []
+        for name in unexpected:
+            if (suggestions := difflib.get_close_matches(name, missing, n=3)):
+                top3 = ' or '.join(repr(s) for s in suggestions)
+                subparts.append(f"{name!r} (did you mean {top3} ?)")
+            else:
+                subparts.append(repr(name))
+        msgparts.append("unexpected: " + ', '.join(subparts))
+    if missing:
+        msgparts.append("missing: " + ', '.join(repr(name) for name in missing))
+    return ", ".join(msgparts)
+
+
+def valuediff_msg(
+        name: str,
+        value: None|int,
+        expected: None|int|Sequence[None|int]
+        ) -> Optional[str]:
+    """Return a message describing a diff in signature items."""
+    if expected is None:
+        if value is not None:
+            return f"{name}: is a group, expected was a single input"
+    elif value is None:
+        return f"{name}: is a single input, expected was a group"
+    elif isinstance(expected, int):
+        if value != expected:
+            return f"group {name}: input count is {value}, expected was {expected}"
+    else:
+        try:
+            cmin, cmax = expected
+        except Exception:
+            raise ValueError(
+                f"check_signature: input {name!r}: invalid value {expected!r}"
+                ) from None
+        if cmin is not None and value < cmin:
+            return f"group {name}: input count is {value}, minimum is {cmin}"
+        if cmax is not None and value > cmax:
+            return f"group {name}: input count is {value}, maximum is {cmax}"
+    return None # no error
@@ -4,6 +4,9 @@ Test basic circuit block functionality.
 
 # pylint: disable=missing-class-docstring, protected-access
 
+import gc
+import weakref
+
 import pytest
 
 import edzed
@@ -35,6 +38,31 @@ def test_const():
     UNHASHABLE = [0]
     cu1 = edzed.Const(UNHASHABLE)
     assert cu1.output == UNHASHABLE
+    # equal values of different types are not shared
+    c1 = edzed.Const(1)
+    ctrue = edzed.Const(True)
+    assert c1 is not ctrue
+    assert type(c1.output) is int      # pylint: disable=unidiomatic-typecheck
+    assert ctrue.output is True
+    # the same applies to items of equal containers
+    ct1 = edzed.Const((1,))
+    cttrue = edzed.Const((True,))
+    assert ct1 is not cttrue
+    assert ct1.output[0] is not True
+    assert cttrue.output[0] is True
+
+
+def test_const_not_kept_alive():
+    """Only scalar values are cached, other values are not kept alive."""
+    class Value:
+        pass
+
+    value = Value()
+    ref = weakref.ref(value)
+    edzed.Const(value)
+    del value
+    gc.collect()
+    assert ref() is None
 
 
 def test_no_undef_const():
@@ -196,6 +224,19 @@ def test_is_multiple_and_to_tuple():
         to_tuple(0, lambda x: 1/x)
 
 
+def test_event_tuple(circuit):
+    """event_tuple/efilter_tuple return plain tuples."""
+    event = edzed.Event('dest')
+    etuple = edzed.event_tuple([event])
+    assert etuple == (event,)
+    assert type(etuple) is tuple        # pylint: disable=unidiomatic-typecheck
+    assert edzed.event_tuple(etuple) == etuple
+    with pytest.raises(TypeError, match="callable"):
+        edzed.block.efilter_tuple(etuple)
+    ftuple = edzed.block.efilter_tuple(bool)
+    assert type(ftuple) is tuple        # pylint: disable=unidiomatic-typecheck
+
+
 # RUNNING THIS TEST MAY AFFECT OTHER TESTS!
 # https://bugs.python.org/issue38085
 # until a bugfix, the following three tests must be run in a separate process
@@ -248,3 +289,11 @@ def test_has_method():
         # has its own method
         assert getattr(myes, name, None) is not None
         assert myes.has_method(name)
+
+
+def test_slots(circuit):
+    """Base classes have slots, concrete blocks may have more attributes."""
+    assert not hasattr(edzed.Event('dest'), '__dict__')
+    blk = Noop('test', x_attr=1)
+    assert 'name' not in vars(blk)
+    assert vars(blk) == {'x_attr': 1}
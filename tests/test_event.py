@@ -224,6 +224,34 @@ def test_on_every_output(circuit):
     assert dest_every.output == ('ev', {**CDATA, 'previous': 911, 'value': 911})
 
 
+def test_duck_typed_output_events(circuit):
+    """Event-like objects with a send() method are accepted by on_output."""
+    class Spy:
+        def __init__(self):
+            self.sent = []
+
+        def send(self, source, /, **data):
+            self.sent.append((source.name, data))
+
+    spy1 = Spy()
+    spy2 = Spy()
+    src = edzed.Input('src', on_output=spy1, on_every_output=spy2, initdef=None)
+    init(circuit)
+
+    CDATA = {'trigger': 'output'}
+    edzed.ExtEvent(src).send(1)
+    edzed.ExtEvent(src).send(1)
+    assert spy1.sent == [
+        ('src', {**CDATA, 'previous': edzed.UNDEF, 'value': None}),
+        ('src', {**CDATA, 'previous': None, 'value': 1}),
+        ]
+    assert spy2.sent == [
+        ('src', {**CDATA, 'previous': edzed.UNDEF, 'value': None}),
+        ('src', {**CDATA, 'previous': None, 'value': 1}),
+        ('src', {**CDATA, 'previous': 1, 'value': 1}),
+        ]
+
+
 def test_multiple_events(circuit):
     """Test multiple events."""
     dest1 = EventMemory('dest2')
@@ -250,6 +278,10 @@ def test_multiple_events(circuit):
 def test_conditional_events(circuit):
     """Test conditional events."""
     assert edzed.EventCond('T', 'F') == edzed.EventCond(efalse='F', etrue='T')
+    with pytest.raises(ValueError, match="empty"):
+        edzed.EventCond('T', '')
+    with pytest.raises(TypeError, match="string"):
+        edzed.EventCond(0, 'F')
 
     cnt = edzed.Counter('counter')
     init(circuit)
@@ -122,14 +122,16 @@ def test_dataedit_filter(circuit):
                 edzed.DataEdit.modify('a', lambda a: edzed.DataEdit.DELETE if a == 52 else a+1),
                 check({'source': 'src', 'value': 'V', 'a': 52, 'saved': 'YES'}),
                 edzed.DataEdit.modify('a', lambda a: edzed.DataEdit.DELETE if a == 52 else a+1),
-                check({'source': 'src', 'value': 'V', 'saved': 'YES'})
+                check({'source': 'src', 'value': 'V', 'saved': 'YES'}),
+                edzed.DataEdit.delete('missing', 'saved'),
+                check({'source': 'src', 'value': 'V'})
             )),
         initdef=None)
     dest = EventMemory('dest')
     init(circuit)
 
     edzed.ExtEvent(src).send('V')
-    assert dest.output == ('put', {'source': 'src', 'value': 'V', 'saved': 'YES'})
+    assert dest.output == ('put', {'source': 'src', 'value': 'V'})
 
 
 def test_chained_dataedit(circuit):
@@ -331,6 +333,13 @@ def test_delta(circuit):
     assert dest.output == 12
 
 
+def test_delta_same_value():
+    """Repeated values are evaluated each time."""
+    delta0 = edzed.Delta(0)
+    inf = float('inf')
+    assert [delta0({'value': v}) for v in (inf, inf, 5, 5)] == [True, False, True, True]
+
+
 def test_ifoutput(circuit):
     """Test the IfOutput."""
 
@@ -221,6 +221,30 @@ async def test_cron(circuit):
     await edzed.run(tester())
 
 
+@pytest.mark.asyncio
+async def test_cron_reset_without_blocks(circuit):
+    """A time tracking reset must work also when no blocks are registered."""
+    cron = edzed.blocklib.cron.Cron('test_cron', utc=False)
+    calls = 0
+
+    def fake_dtnow():
+        nonlocal calls
+        calls += 1
+        # the 1st wake-up time is 11:00; the clock then jumps by several hours
+        if calls == 1:
+            return dt.datetime(2026, 10, 14, 10, 59, 59, 950_000)
+        return dt.datetime(2026, 10, 14, 15, 0, 0)
+    cron.dtnow = fake_dtnow
+
+    async def tester():
+        await circuit.wait_init()
+        await asyncio.sleep(0.2)
+        # the clock jump was detected; a failed reset would abort the simulation
+        assert calls > 2
+
+    await edzed.run(tester())
+
+
 def test_parse():
     parse = edzed.TimeDate.parse
     assert parse(None, None, None) == {'times': None, 'dates': None, 'weekdays': None}
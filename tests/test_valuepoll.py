@@ -66,6 +66,56 @@ async def test_async(circuit):
     logger.compare(LOG)
 
 
+async def test_slow_func(circuit):
+    """The duration of the call does not prolong the interval."""
+    n = 0
+    async def acq():
+        nonlocal n
+        n += 1
+        await asyncio.sleep(0.03)
+        return n
+
+    logger = TimeLogger('logger')
+    edzed.ValuePoll(
+        'out',
+        func=acq,
+        interval=0.05,
+        on_output=edzed.Event(logger, 'log'))
+    await edzed.run(asyncio.sleep(0.2))
+
+    LOG = [
+        (30, 1),
+        (80, 2),
+        (130, 3),
+        (180, 4)]
+    logger.compare(LOG)
+
+
+async def test_too_slow_func(circuit):
+    """A call longer than the interval starts a new schedule."""
+    n = 0
+    async def acq():
+        nonlocal n
+        n += 1
+        await asyncio.sleep(0.08 if n == 1 else 0.01)
+        return n
+
+    logger = TimeLogger('logger')
+    edzed.ValuePoll(
+        'out',
+        func=acq,
+        interval=0.05,
+        on_output=edzed.Event(logger, 'log'))
+    await edzed.run(asyncio.sleep(0.2))
+
+    LOG = [
+        (80, 1),    # 30 ms late, the next call follows immediately
+        (90, 2),
+        (140, 3),
+        (190, 4)]
+    logger.compare(LOG)
+
+
 async def test_undef(circuit):
     """UNDEF menas data not available."""
     n = 0